@@ -12,22 +12,51 @@
 # Repository: https://github.com/triemerge/voxify
 
 # Standard Library Imports
+import io
 import os
+import time
+import hashlib
+import functools
 import contextlib
-from typing import Optional, List, Dict, Any
+from concurrent.futures import ThreadPoolExecutor  # Parallel Polly calls for long texts
+from typing import Optional, List, Dict, Any, Tuple
 
 # Third-Party Imports
 import boto3  # AWS SDK for Python, allows connection to Amazon Polly
 import streamlit as st  # The framework used to building the web UI
 from dotenv import load_dotenv  # For loading .env files locally (security best practice)
+from botocore.config import Config  # Fine-grained HTTP/retry tuning for the AWS client
 from botocore.exceptions import BotoCoreError, ClientError  # Specific AWS error types
 
+# Optional: browser cookies for remembering returning visitors.
+# Without it the welcome modal reappears on every new session (new tab,
+# server restart); with it the "seen" flag lives in the browser and the
+# modal render + remote avatar fetch are skipped entirely. The app works
+# fine either way, so a missing package must not break the import.
+try:
+    from streamlit_cookies_manager import CookieManager
+except ImportError:
+    CookieManager = None
+
 # --- Configuration & Constants ---
 
-# Load environment variables from a .env file if it exists.
-# This is crucial for local development to keep keys out of the code.
-# In production (Docker/AWS), these values usually come from the system environment.
-load_dotenv()
+# Loading environment variables from a .env file is crucial for local
+# development to keep keys out of the code. In production (Docker/AWS), these
+# values usually come from the system environment.
+#
+# We do it lazily rather than at import time: load_dotenv() walks the
+# filesystem looking for a .env file, and under Streamlit's autoreload (and
+# in multi-worker deployments) the module-level call would re-pay that disk
+# walk on every fresh import. The sentinel makes it a one-shot per process,
+# triggered the first time anything actually needs the environment.
+_env_loaded = False
+
+def _ensure_env() -> None:
+    """Load the .env file exactly once per process (no-op on later calls)."""
+    global _env_loaded
+    if not _env_loaded:
+        load_dotenv()
+        _env_loaded = True
 
 # App-Wide Logic Configuration
 PAGE_TITLE = "Amazon Polly TTS Converter" # Browser tab title
@@ -38,9 +67,11 @@ LAYOUT = "wide" # Use the full width of the browser
 # We default to 'us-east-1' because it's the most reliable region for new features like Neural voices.
 DEFAULT_REGION = "us-east-1" 
 
-# We filter the voice list to only show US and UK English to keep the UI clean.
+# We only show US and UK English voices to keep the UI clean.
 # Polly supports dozens of languages, but listing them all would be overwhelming for this specific tool.
-TARGET_LANGUAGES = ['en-US', 'en-GB'] 
+# A frozenset makes any membership test O(1) and signals the set is immutable;
+# iteration order doesn't matter because the voice list is sorted afterwards.
+TARGET_LANGUAGES = frozenset({'en-US', 'en-GB'})
 
 # 'neural' is the highest quality engine. 'standard' is cheaper but robotics.
 # We hardcode 'neural' because the goal is high-quality output.
@@ -49,12 +80,50 @@ ENGINE = 'neural'
 # 'mp3' is the best format for general web playback. 'pcm' is for raw audio data.
 OUTPUT_FORMAT = 'mp3'
 
+# Name of the browser cookie that marks the welcome modal as already seen.
+WELCOME_COOKIE = 'voxify_welcome'
+
+# Texts longer than this are split into sentence-aligned chunks and synthesized
+# in parallel. Polly's neural engine allows several concurrent requests, so
+# splitting a long input cuts the wall-clock time roughly linearly.
+CHUNK_THRESHOLD = 1400
+
+# How many chunks we synthesize at once. Polly neural allows 8 tps, so going
+# higher than 8 would just trip the throttle and trigger retries.
+MAX_SYNTH_WORKERS = 8
+
+# Texts above ASYNC_THRESHOLD are handed to StartSpeechSynthesisTask when an
+# S3 bucket is configured (see _s3_output_bucket below) — Polly then writes
+# the MP3 straight to S3, the audio bytes never pass through this process,
+# and the browser streams the file from a presigned URL instead.
+ASYNC_THRESHOLD = 1500
+
+# How long the presigned playback URL stays valid (seconds) and how long we
+# are willing to wait for an async task before giving up.
+PRESIGN_EXPIRY = 3600
+ASYNC_POLL_TIMEOUT = 60
+
 # --- UI Styles & Content ---
+#
+# The large HTML/CSS blocks live inside @functools.cache factories rather
+# than module-level constants. Streamlit re-executes the whole module on
+# every script rerun, so module-level string assembly runs each time; a
+# cached factory builds the string on first use and returns the very same
+# object afterwards — and importing this file as a library builds nothing
+# at all. st.markdown also gets an identical object every rerun, which
+# keeps its component diffing cheap.
 
-# Custom CSS to force the footer to stay at the bottom of the screen.
-# Streamlit doesn't have a native footer component, so we inject HTML/CSS.
-# 'pointer-events: none' on the container allows users to click buttons BEHIND the transparent footer.
-FOOTER_STYLE = """
+@functools.cache
+def _footer_html() -> str:
+    """
+    Build the footer markup (CSS + content), once per process.
+
+    Custom CSS forces the footer to stay at the bottom of the screen —
+    Streamlit doesn't have a native footer component, so we inject HTML/CSS.
+    'pointer-events: none' on the container allows users to click buttons
+    BEHIND the transparent footer.
+    """
+    return """
 <style>
 .footer {
 position: fixed;
@@ -79,11 +148,21 @@ font-weight: bold;
 text-decoration: underline;
 }
 </style>
+<div class="footer">
+Built with 💻 by <a href="https://github.com/triemerge" target="_blank">Aditya Kumar Gupta</a> |
+<a href="https://github.com/triemerge/voxify" target="_blank">Repo</a>
+</div>
 """
 
-# HTML for the "Welcome" popup modal.
-# We use standard HTML inside Streamlit's markdown to get precise control over layout (centering, image borders).
-WELCOME_MODAL_HTML = """
+@functools.cache
+def _welcome_modal_html() -> str:
+    """
+    Build the HTML for the "Welcome" popup modal, once per process.
+
+    We use standard HTML inside Streamlit's markdown to get precise control
+    over layout (centering, image borders).
+    """
+    return """
 <div style="text-align: center; padding: 0px;">
 <!-- Profile Picture with a border matching the theme color -->
 <img src="https://github.com/triemerge.png" style="width: 120px; height: 120px; border-radius: 50%; border: 4px solid #ff4b4b; margin-bottom: 15px;">
@@ -124,6 +203,31 @@ st.set_page_config(
 
 # --- Backend Logic (AWS Polly) ---
 
+@st.cache_resource
+def _session() -> Any:
+    """
+    Return the process-wide boto3 Session shared by every AWS client.
+
+    Creating a client via the module-level boto3.client() spins up a fresh
+    default Session each time, and each Session re-walks the credential
+    provider chain (env vars, shared credentials file, instance metadata...)
+    — tens of milliseconds apiece. Caching one Session and deriving all
+    clients (Polly, S3, and anything added later) from it pays that cost
+    exactly once per process.
+    """
+    _ensure_env()
+    return boto3.Session(region_name=os.getenv("AWS_REGION", DEFAULT_REGION))
+
+def _s3_output_bucket() -> str:
+    """
+    Return the optional S3 bucket for audio output, or "" when not configured.
+
+    Read lazily (after _ensure_env) so a bucket defined in a local .env file
+    is picked up without forcing the .env disk walk at import time.
+    """
+    _ensure_env()
+    return os.getenv("POLLY_S3_BUCKET", "")
+
 @st.cache_resource
 def get_polly_client() -> Optional[Any]:
     """
@@ -139,126 +243,433 @@ def get_polly_client() -> Optional[Any]:
     Returns:
         boto3.client: The initialized Polly client object, or None if initialization fails.
     """
-    # Fallback to us-east-1 if no region is specified in the environment
-    region_name = os.getenv("AWS_REGION", DEFAULT_REGION)
-    
     try:
-        client = boto3.client('polly', region_name=region_name)
+        # Every synthesize call hits the same HTTPS endpoint, so we tune the
+        # connection handling instead of using botocore's defaults:
+        # - max_pool_connections: keep up to 50 sockets alive instead of 10,
+        #   so repeated calls reuse the TLS connection (no re-handshake).
+        # - tcp_keepalive: stops idle connections being silently dropped
+        #   between user interactions.
+        # - adaptive retries: Polly's neural engine is capped at 8 tps (burst
+        #   of 10) and signals overload with ThrottlingException. Adaptive
+        #   mode keeps a client-side token bucket paced to the observed
+        #   service rate and retries with exponential backoff + jitter, so
+        #   throttles recover silently instead of surfacing as user-visible
+        #   errors; only permanent failures reach our except blocks. Eight
+        #   attempts mirrors the 8 tps cap — enough to ride out a burst
+        #   without hammering an endpoint that is genuinely down.
+        # The region comes from the shared Session (see _session).
+        cfg = Config(
+            max_pool_connections=50,
+            tcp_keepalive=True,
+            retries={"max_attempts": 8, "mode": "adaptive"},
+            connect_timeout=3,
+            read_timeout=30,
+        )
+        client = _session().client('polly', config=cfg)
         return client
     except Exception as e:
         # If we can't create a client (e.g., missing library), show an error on the UI
         st.error(f"Failed to initialize AWS Polly client: {e}")
         return None
 
-@st.cache_data
+@st.cache_resource
+def get_s3_client() -> Optional[Any]:
+    """
+    Initialize an S3 client for presigning URLs to async synthesis output.
+
+    Only used when an output bucket is configured. Derived from the shared
+    Session (see _session) so it reuses the credentials and region already
+    resolved for the Polly client instead of walking the provider chain again.
+
+    Returns:
+        boto3.client: The initialized S3 client object, or None if initialization fails.
+    """
+    try:
+        return _session().client('s3')
+    except Exception as e:
+        st.error(f"Failed to initialize AWS S3 client: {e}")
+        return None
+
+@st.cache_data(ttl=86400, persist="disk")
 def get_available_voices(_client) -> List[Dict[str, Any]]:
     """
-    Fetch and filter available voices from Amazon Polly.
-    
+    Fetch available voices from Amazon Polly for our target languages.
+
     This uses @st.cache_data because the list of AWS voices doesn't change often.
     Caching this prevents us from making a slow API call every time the user types a letter.
-    
+    The result is also persisted to disk (refreshed daily), so a container
+    restart skips the AWS round trip entirely on its first page load.
+
+    AWS errors deliberately propagate out of this function: st.cache_data
+    never caches a call that raises, so a transient failure at cold start
+    can't be frozen into the disk cache as an empty voice list for the next
+    24 hours. The caller (main) catches and reports them, and the next rerun
+    simply retries the fetch.
+
     Args:
         _client: The boto3 Polly client.
-        
+
     Returns:
         List[Dict]: A list of dictionary objects representing the voices.
                     Example structure: [{'Id': 'Joanna', 'Name': 'Joanna', 'LanguageCode': 'en-US', ...}]
-                    Returns an empty list on error.
+
+    Raises:
+        BotoCoreError, ClientError: When the describe_voices calls fail.
     """
-    try:
-        # Request voices specifically for the 'neural' engine (higher quality)
-        response = _client.describe_voices(
-            Engine=ENGINE,
-            IncludeAdditionalLanguageCodes=False
-        )
-        
-        voices = response.get('Voices', [])
-        
-        # Filter Logic:
-        # We look through the list of 50+ voices and keep only the ones
-        # that match our target languages (US and UK English).
-        filtered_voices = [
-            v for v in voices 
-            if v.get('LanguageCode') in TARGET_LANGUAGES
-        ]
-        
-        # Sorting Logic:
-        # Users expect lists to be organized. We sort first by Language (US vs UK),
-        # and then alphabetically by Name (Amy, Brian, etc.).
-        filtered_voices.sort(key=lambda x: (x['LanguageCode'], x['Name']))
-        
-        return filtered_voices
-        
-    except (BotoCoreError, ClientError) as error:
-        # Specific AWS errors (like 'InvalidSignature' or 'NetworkError')
-        st.error(f"Error fetching voices from AWS: {error}")
-        return []
-    except Exception as e:
-        # Generic Python errors (like variable names wrong)
-        st.error(f"Unexpected error while fetching voices: {e}")
-        return []
+    # describe_voices accepts a LanguageCode filter, so instead of pulling
+    # the full 50+ voice catalog and filtering it in Python, we issue one
+    # targeted request per language we actually show (US and UK English).
+    #
+    # Note on JSON overhead: describe_voices is the only JSON-heavy call
+    # in the app (synthesize_speech streams binary audio), and the disk-
+    # persisted cache above means botocore parses that response at most
+    # once per deploy. That makes swapping in a faster JSON library (or
+    # monkeypatching botocore's parser) not worth the fragility.
+    #
+    # Requesting the 'neural' engine specifically (higher quality), with
+    # the server already scoping each response to one language, so no
+    # IncludeAdditionalLanguageCodes flag and no Python-side filtering is
+    # needed. The generator feeds sorted() directly — one pass over the
+    # responses, no intermediate list.
+    #
+    # Sorting Logic:
+    # Users expect lists to be organized. We sort first by Language (US vs UK),
+    # and then alphabetically by Name (Amy, Brian, etc.).
+    return sorted(
+        (
+            voice
+            for language_code in TARGET_LANGUAGES
+            for voice in _client.describe_voices(
+                Engine=ENGINE,
+                LanguageCode=language_code
+            ).get('Voices', [])
+        ),
+        key=lambda x: (x['LanguageCode'], x['Name'])
+    )
+
+@st.cache_data
+def _build_voice_options(voices_tuple) -> tuple:
+    """
+    Build the (label, voice id) pairs shown in the voice dropdown.
+
+    Streamlit re-runs main() on every widget interaction — including every
+    keystroke in the text area — and rebuilding the label dict with f-strings
+    each time is pure waste. The voices tuple is hashable, so we cache the
+    formatted pairs and only pay the formatting cost when the voice list
+    actually changes.
+
+    Args:
+        voices_tuple: Tuple of (Name, LanguageCode, Gender, Id) per voice.
+
+    Returns:
+        tuple: Ordered (label, voice_id) pairs, e.g. ("Joanna (en-US - Female)", "Joanna").
+    """
+    return tuple(
+        (f"{name} ({lang_code} - {gender})", voice_id)
+        for name, lang_code, gender, voice_id in voices_tuple
+    )
+
+def _split_text(text: str, max_len: int = CHUNK_THRESHOLD) -> List[str]:
+    """
+    Split a long text into chunks of at most max_len characters.
+
+    We cut on sentence boundaries ('. ', '? ', '! ') so each chunk sounds
+    natural on its own — Polly adds the right intonation per sentence, and we
+    never split a sentence in the middle of a word.
+
+    Args:
+        text (str): The full input text.
+        max_len (int): Maximum size of each chunk in characters.
+
+    Returns:
+        List[str]: The ordered chunks. Joining them reproduces the sentences
+                   of the original text.
+    """
+    chunks = []
+    current = ""
+
+    # Walk through the text sentence by sentence, packing sentences into the
+    # current chunk until adding one more would exceed the limit.
+    remaining = text
+    while remaining:
+        # Find the earliest sentence-ending punctuation followed by a space.
+        cut = -1
+        for sep in ('. ', '? ', '! '):
+            idx = remaining.find(sep)
+            if idx != -1 and (cut == -1 or idx < cut):
+                cut = idx
+
+        if cut == -1:
+            # No sentence boundary left — the rest is one final "sentence".
+            sentence, remaining = remaining, ""
+        else:
+            # Keep the punctuation with the sentence (cut + 2 includes ". ").
+            sentence, remaining = remaining[:cut + 2], remaining[cut + 2:]
+
+        if current and len(current) + len(sentence) > max_len:
+            chunks.append(current)
+            current = sentence
+        else:
+            current += sentence
+
+    if current:
+        chunks.append(current)
+
+    return chunks
+
+def _synthesize_chunk(client, text: str, voice_id: str) -> bytes:
+    """
+    Synthesize a single chunk of text and return the raw MP3 bytes.
+
+    This is the one place that actually talks to the Polly API, so both the
+    single-shot path and the parallel path funnel through it.
+    """
+    response = client.synthesize_speech(
+        Text=text,
+        OutputFormat=OUTPUT_FORMAT, # Requesting mp3
+        VoiceId=voice_id,
+        Engine=ENGINE, # Forcing neural engine
+        TextType='text' # We are sending plain text, not SSML code
+    )
+
+    # The 'AudioStream' in the response is a "StreamingBody".
+    # Draining it in fixed 64 KB chunks into a BytesIO lets the buffer grow
+    # incrementally instead of forcing botocore to allocate one contiguous
+    # bytes object for the whole MP3 up front — one less full-size copy for
+    # outputs that can run to several hundred KB at the 3000-char cap.
+    buf = io.BytesIO()
+    stream = response['AudioStream']
+    for chunk in iter(lambda: stream.read(65536), b''):
+        buf.write(chunk)
+    return buf.getvalue()
+
+@st.cache_data(max_entries=128, ttl=3600, show_spinner=False)
+def _cached_synthesize(_client, voice_id: str, text: str) -> bytes:
+    """
+    Synthesize text and cache the resulting MP3 bytes by (voice_id, text).
+
+    Re-synthesizing the exact same text with the same voice is a common click
+    pattern, and every repeat costs a network round trip plus a slice of
+    Polly's 8 tps neural quota. @st.cache_data keys the result on the
+    arguments, so identical requests come back from memory in microseconds.
+
+    The leading underscore on _client tells Streamlit to leave the client out
+    of the cache key (boto3 clients aren't hashable) — same trick as in
+    get_available_voices.
+    """
+    if len(text) > CHUNK_THRESHOLD:
+        # Long input: fan the chunks out over a small thread pool.
+        # Each worker reuses the shared client's pooled HTTPS connections.
+        chunks = _split_text(text)
+        with ThreadPoolExecutor(max_workers=MAX_SYNTH_WORKERS) as executor:
+            parts = list(executor.map(
+                lambda chunk: _synthesize_chunk(_client, chunk, voice_id),
+                chunks
+            ))
+        return b''.join(parts)
+
+    return _synthesize_chunk(_client, text, voice_id)
 
 def synthesize_audio(client, text: str, voice_id: str) -> Optional[bytes]:
     """
     Convert text to speech using Amazon Polly's synthesize_speech API.
-    
+
     This is the core function of the app. It sends text to AWS cloud and gets back audio data.
-    
+
+    Short texts go out as a single request. Long texts are split on sentence
+    boundaries and synthesized concurrently (boto3 clients are thread-safe),
+    then the MP3 parts are concatenated — MP3 frames are independently
+    decodable, so simple byte concatenation produces a valid file. Results
+    are cached per (voice_id, text), so repeat clicks skip the API entirely.
+
     Args:
         client: The boto3 Polly client.
         text (str): The input text to convert.
         voice_id (str): The ID of the voice to use (e.g., 'Joanna').
-        
+
     Returns:
         bytes: The raw audio data content, or None if failed.
     """
     try:
-        response = client.synthesize_speech(
+        return _cached_synthesize(client, voice_id, text)
+
+    except (BotoCoreError, ClientError) as error:
+        st.error(f"AWS Polly Synthesis Error: {error}")
+    except Exception as e:
+        st.error(f"An unexpected error occurred during synthesis: {e}")
+
+    return None
+
+def _presign_audio_urls(s3, bucket: str, key: str) -> Tuple[str, str]:
+    """
+    Presign a (playback, download) URL pair for an MP3 object in S3.
+
+    The objects are stored with ContentType audio/mp3, so a plain presigned
+    GET opens inline in the browser — right for the audio player, wrong for
+    the "Download MP3" link, which would pop an audio tab instead of saving
+    a file. The download URL therefore overrides the response's
+    Content-Disposition to attachment with a proper filename. Presigning is
+    pure local crypto (no network call), so the second URL is effectively free.
+
+    Args:
+        s3: The boto3 S3 client.
+        bucket (str): The bucket holding the object.
+        key (str): The object key.
+
+    Returns:
+        Tuple[str, str]: (playback_url, download_url).
+    """
+    playback_url = s3.generate_presigned_url(
+        'get_object',
+        Params={'Bucket': bucket, 'Key': key},
+        ExpiresIn=PRESIGN_EXPIRY
+    )
+    download_url = s3.generate_presigned_url(
+        'get_object',
+        Params={
+            'Bucket': bucket,
+            'Key': key,
+            'ResponseContentDisposition': 'attachment; filename="polly_output.mp3"'
+        },
+        ExpiresIn=PRESIGN_EXPIRY
+    )
+    return playback_url, download_url
+
+def _publish_audio(audio_bytes: bytes) -> Optional[Tuple[str, str]]:
+    """
+    Upload synthesized audio to S3 and return presigned playback/download URLs.
+
+    Passing raw bytes to st.audio base64-embeds the whole MP3 into the page,
+    and the download button sends the same bytes a second time — every rerun
+    pushes the full payload down the Streamlit WebSocket twice. Parking the
+    file in S3 once and handing the browser a short URL instead means the
+    session only ever carries a ~40-char key and the audio is fetched (and
+    browser-cached) straight from S3.
+
+    The object key is the SHA-1 of the content, so re-synthesizing identical
+    text overwrites the same object instead of accumulating duplicates.
+
+    Args:
+        audio_bytes (bytes): The MP3 data to publish.
+
+    Returns:
+        Tuple[str, str]: Presigned (playback, download) URLs for the uploaded
+                         MP3, or None if failed (callers fall back to in-page
+                         bytes playback).
+    """
+    s3 = get_s3_client()
+    if not s3:
+        return None
+
+    bucket = _s3_output_bucket()
+
+    try:
+        key = f"tts/{hashlib.sha1(audio_bytes).hexdigest()}.mp3"
+        s3.put_object(
+            Bucket=bucket,
+            Key=key,
+            Body=audio_bytes,
+            ContentType='audio/mp3'
+        )
+        return _presign_audio_urls(s3, bucket, key)
+    except (BotoCoreError, ClientError) as error:
+        # Not fatal — the caller still has the bytes and can embed them.
+        st.warning(f"Could not upload audio to S3, falling back to inline playback: {error}")
+        return None
+
+def synthesize_audio_async(client, text: str, voice_id: str) -> Optional[Tuple[str, str]]:
+    """
+    Convert long text to speech using Polly's asynchronous task API.
+
+    StartSpeechSynthesisTask returns immediately and Polly writes the finished
+    MP3 to S3 on its own. We poll the task status briefly, then hand the
+    browser presigned URLs — the audio never has to be buffered inside the
+    Streamlit process, which matters for texts near the 3000-char cap.
+
+    Args:
+        client: The boto3 Polly client.
+        text (str): The input text to convert.
+        voice_id (str): The ID of the voice to use (e.g., 'Joanna').
+
+    Returns:
+        Tuple[str, str]: Presigned (playback, download) URLs for the generated
+                         MP3, or None if failed.
+    """
+    s3 = get_s3_client()
+    if not s3:
+        return None
+
+    bucket = _s3_output_bucket()
+
+    try:
+        task = client.start_speech_synthesis_task(
+            OutputS3BucketName=bucket,
+            OutputS3KeyPrefix="tts/",
             Text=text,
-            OutputFormat=OUTPUT_FORMAT, # Requesting mp3
+            OutputFormat=OUTPUT_FORMAT,
             VoiceId=voice_id,
-            Engine=ENGINE, # Forcing neural engine
-            TextType='text' # We are sending plain text, not SSML code
-        )
-        
-        # The 'AudioStream' in the response is a "StreamingBody".
-        # We need to .read() it to get the actual bytes of the MP3 file.
-        if 'AudioStream' in response:
-            return response['AudioStream'].read()
-            
+            Engine=ENGINE,
+            TextType='text'
+        )['SynthesisTask']
+
+        # Poll until Polly reports the task is done. Short texts finish in a
+        # couple of seconds; we back off gently and bail out after a minute
+        # rather than hanging the worker forever.
+        deadline = time.monotonic() + ASYNC_POLL_TIMEOUT
+        while task['TaskStatus'] in ('scheduled', 'inProgress'):
+            if time.monotonic() > deadline:
+                st.error("Speech synthesis task timed out. Please try again.")
+                return None
+            time.sleep(0.5)
+            task = client.get_speech_synthesis_task(
+                TaskId=task['TaskId']
+            )['SynthesisTask']
+
+        if task['TaskStatus'] != 'completed':
+            st.error(f"Speech synthesis task failed: {task.get('TaskStatusReason', 'unknown reason')}")
+            return None
+
+        # OutputUri looks like https://s3.<region>.amazonaws.com/<bucket>/tts/<task-id>.mp3
+        # The bucket is private, so we presign the object for playback/download.
+        key = task['OutputUri'].split(f"/{bucket}/", 1)[1]
+        return _presign_audio_urls(s3, bucket, key)
+
     except (BotoCoreError, ClientError) as error:
         st.error(f"AWS Polly Synthesis Error: {error}")
     except Exception as e:
         st.error(f"An unexpected error occurred during synthesis: {e}")
-    
+
     return None
 
 # --- UI Components ---
 
 def display_footer():
     """Renders the fixed footer at the bottom of the page using HTML injection."""
-    footer_html = f"""
-{FOOTER_STYLE}
-<div class="footer">
-Built with 💻 by <a href="https://github.com/triemerge" target="_blank">Aditya Kumar Gupta</a> | 
-<a href="https://github.com/triemerge/voxify" target="_blank">Repo</a>
-</div>
-"""
-    st.markdown(footer_html, unsafe_allow_html=True)
+    st.markdown(_footer_html(), unsafe_allow_html=True)
 
 @st.dialog("✨ Welcome to Voxify", width="large")
-def show_welcome_modal():
+def show_welcome_modal(cookies):
     """
     Displays the welcome modal with author information.
     Uses st.dialog() which creates a modal that dims the rest of the screen.
+
+    Args:
+        cookies: The CookieManager instance (or None when the optional
+                 package isn't installed) used to persist the "seen" flag
+                 across browser sessions.
     """
-    st.markdown(WELCOME_MODAL_HTML, unsafe_allow_html=True)
-    
+    st.markdown(_welcome_modal_html(), unsafe_allow_html=True)
+
     # When the user clicks this button, we update 'session_state'.
     # st.rerun() forces the app to refresh, noticing the new state and hiding the modal.
     if st.button("Let's Get Started!", type="primary", use_container_width=True):
         st.session_state['welcome_shown'] = True
+        # Persist the flag in the browser so returning visitors (new tab,
+        # server restart) skip the modal — and its remote avatar fetch — entirely.
+        if cookies is not None and cookies.ready():
+            cookies[WELCOME_COOKIE] = '1'
+            cookies.save()
         st.rerun()
 
 # --- Main Application Loop ---
@@ -273,11 +684,27 @@ def main():
     # 'session_state' is how we remember variables (like the generated audio) across re-runs.
     if 'audio_bytes' not in st.session_state:
         st.session_state['audio_bytes'] = None
+    # For S3-backed synthesis we only keep presigned URLs around — one for
+    # inline playback, one with attachment disposition for the download link.
+    # The browser fetches the audio from S3 directly in both cases.
+    if 'audio_url' not in st.session_state:
+        st.session_state['audio_url'] = None
+    if 'download_url' not in st.session_state:
+        st.session_state['download_url'] = None
     
     # 2. Show Welcome Modal
+    # Returning visitors carry a cookie set the first time they dismissed the
+    # modal, which lets us skip the render (and its remote image fetch) even
+    # though the server-side session is brand new. The cookie check is best
+    # effort: if the optional package is missing or the browser hasn't synced
+    # cookies yet, we simply fall back to the per-session behaviour.
+    cookies = CookieManager() if CookieManager is not None else None
+    if cookies is not None and cookies.ready() and cookies.get(WELCOME_COOKIE):
+        st.session_state['welcome_shown'] = True
+
     # We check if 'welcome_shown' exists. If not, it means this is the user's first visit.
     if 'welcome_shown' not in st.session_state:
-        show_welcome_modal()
+        show_welcome_modal(cookies)
 
     # 3. Display Persistent Footer
     display_footer()
@@ -293,24 +720,46 @@ def main():
     st.sidebar.header("Configuration")
     
     # Fetch voices dynamically. The spinner shows a visual loading indicator while waiting for AWS.
+    # Errors are caught here rather than inside get_available_voices, so a
+    # failed fetch is reported and retried on the next rerun instead of being
+    # cached (and disk-persisted) as an empty voice list.
     with st.spinner("Connecting to AWS Polly..."):
-        voices = get_available_voices(client)
-    
+        try:
+            voices = get_available_voices(client)
+        except (BotoCoreError, ClientError) as error:
+            # Specific AWS errors (like 'InvalidSignature' or 'NetworkError')
+            st.error(f"Error fetching voices from AWS: {error}")
+            voices = []
+        except Exception as e:
+            # Generic Python errors (like variable names wrong)
+            st.error(f"Unexpected error while fetching voices: {e}")
+            voices = []
+
     if not voices:
         st.error("❌ No voices found. Check your AWS connection and Region.")
         st.stop()
         
-    # Create a mapping for the Dropdown menu.
+    # Create the entries for the Dropdown menu.
     # User sees: "Joanna (en-US - Female)"
     # Code sees: "Joanna" (The ID required by API)
-    voice_options = {f"{v['Name']} ({v['LanguageCode']} - {v['Gender']})": v['Id'] for v in voices}
-    
-    selected_voice_label = st.sidebar.selectbox(
+    # The heavy lifting (f-string formatting) is cached in _build_voice_options;
+    # we just reduce the voice dicts to a hashable tuple to key the cache.
+    voices_tuple = tuple(
+        (v['Name'], v['LanguageCode'], v['Gender'], v['Id']) for v in voices
+    )
+    voice_pairs = _build_voice_options(voices_tuple)
+
+    # The selectbox works on positions rather than label strings: we hand it
+    # the index range and let format_func render the cached labels. That way
+    # the selected voice ID is a single O(1) tuple index — no per-rerun dict
+    # rebuild and no label-to-ID lookup.
+    selected_idx = st.sidebar.selectbox(
         "Select Voice",
-        options=list(voice_options.keys())
+        options=range(len(voice_pairs)),
+        format_func=lambda i: voice_pairs[i][0]
     )
     # Retrieve the actual ID based on what the user picked
-    selected_voice_id = voice_options[selected_voice_label]
+    selected_voice_id = voice_pairs[selected_idx][1]
     
     # Informative sidebar footer
     st.sidebar.markdown("---")
@@ -325,40 +774,89 @@ def main():
         help="Type or paste the text you want to convert to speech."
     )
 
+    # Normalize once: a whitespace-only input ("   ") is just as empty as ""
+    # but would otherwise pass the `not text_input` check, get shipped to AWS
+    # (billed, and counted against the 8 tps quota) and only then be rejected.
+    # Stripping up front also normalizes the synthesis-cache key, so "text"
+    # and "text  " hit the same cached entry.
+    clean_text = text_input.strip()
+
     # 7. Synthesis Action
-    # We disable the button if the text area is empty to prevent accidental empty API calls.
-    if st.button("Synthesize Speech", type="primary", disabled=not text_input):
-        if not text_input.strip():
-            st.warning("Please enter some text.")
-        else:
-            with st.spinner("Generating audio..."):
+    # We disable the button if the text area is empty (or whitespace-only)
+    # to prevent accidental empty API calls.
+    if st.button("Synthesize Speech", type="primary", disabled=not clean_text):
+        with st.spinner("Generating audio..."):
+            s3_bucket = _s3_output_bucket()
+            if s3_bucket and len(clean_text) > ASYNC_THRESHOLD:
+                # Big input + S3 configured: let Polly write the MP3 to S3
+                # and keep only the playback/download URLs in the session.
+                audio_urls = synthesize_audio_async(client, clean_text, selected_voice_id)
+                st.session_state['audio_url'], st.session_state['download_url'] = audio_urls or (None, None)
+                st.session_state['audio_bytes'] = None
+
+                if audio_urls:
+                    st.success("Audio generated successfully!")
+            else:
                 # Call our logic function
-                audio_data = synthesize_audio(client, text_input, selected_voice_id)
-                # Save the result to session state so it persists if the user clicks other things
-                st.session_state['audio_bytes'] = audio_data
-                
+                audio_data = synthesize_audio(client, clean_text, selected_voice_id)
+
+                # When an S3 bucket is available, publish the MP3 there and
+                # keep only the presigned URLs in the session — the page then
+                # references the audio instead of embedding it twice (player
+                # + download button) on every rerun.
+                audio_urls = _publish_audio(audio_data) if audio_data and s3_bucket else None
+
+                if audio_urls:
+                    st.session_state['audio_url'], st.session_state['download_url'] = audio_urls
+                    st.session_state['audio_bytes'] = None
+                else:
+                    # Save the result to session state so it persists if the user clicks other things
+                    st.session_state['audio_bytes'] = audio_data
+                    st.session_state['audio_url'] = None
+                    st.session_state['download_url'] = None
+
                 if audio_data:
                     st.success("Audio generated successfully!")
 
     # 8. Output Area (Persistent)
     # We check if there is audio in the session state. If yes, we show the player.
     # This ensures the player doesn't disappear when you interact with other widgets.
-    if st.session_state['audio_bytes']:
+    if st.session_state['audio_url']:
+        # S3 path: the browser streams straight from S3 via the presigned
+        # URLs, so there are no bytes to offer a download button. The link
+        # uses the attachment-disposition URL, which tells the browser to
+        # save the file instead of opening an inline audio tab.
         st.markdown("---")
         st.subheader("Playback & Download")
-        
+        st.audio(st.session_state['audio_url'], format='audio/mp3')
+        st.markdown(f"[Download MP3]({st.session_state['download_url']})")
+    elif st.session_state['audio_bytes']:
+        st.markdown("---")
+        st.subheader("Playback & Download")
+
+        # Both widgets hash and encode whatever payload they're given for
+        # change detection. Wrapping the session bytes in one shared BytesIO
+        # view (rewound between the two reads) hands each widget the same
+        # underlying buffer instead of two independently processed copies of
+        # a potentially several-hundred-KB MP3. This is the fallback path
+        # when no S3 bucket is configured; with S3 the page carries only a URL.
+        audio_buffer = io.BytesIO(st.session_state['audio_bytes'])
+
         # Create two columns layout:
         # Col 1 (75%): The Audio Player
         # Col 2 (25%): The Download Button
         col1, col2 = st.columns([3, 1])
-        
+
         with col1:
-            st.audio(st.session_state['audio_bytes'], format='audio/mp3')
-            
+            st.audio(audio_buffer, format='audio/mp3')
+
         with col2:
+            # The audio player read the buffer to the end — rewind so the
+            # download button sees the full file, not an empty tail.
+            audio_buffer.seek(0)
             st.download_button(
                 label="Download MP3",
-                data=st.session_state['audio_bytes'],
+                data=audio_buffer,
                 file_name="polly_output.mp3",
                 mime="audio/mp3"
             )